@@ -1,5 +1,6 @@
 """Audit logic for detecting placeholder values."""
 
+import os
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -25,7 +26,7 @@ class EnvAuditor:
 
         Returns True if issues were found, False otherwise.
         """
-        if not env_path.exists():
+        if not os.path.exists(env_path):
             self.console.print(
                 f"[red]Error:[/red] .env file not found at {env_path}",
                 style="bold",
@@ -72,24 +73,12 @@ class EnvAuditor:
         issues = []
 
         for key, entry in entries.items():
-            if self.validator.is_placeholder(entry.value):
-                reason = self._get_placeholder_reason(entry.value)
+            reason = self.validator.get_placeholder_reason(entry.value)
+            if reason:
                 issues.append((key, entry.value, reason))
 
         return issues
 
-    def _get_placeholder_reason(self, value: str) -> str:
-        """Get a human-readable reason why a value is considered a placeholder."""
-        if not value or not value.strip():
-            return "Empty value"
-
-        for pattern in self.validator.PLACEHOLDER_PATTERNS:
-            import re
-            if re.search(pattern, value):
-                return "Contains placeholder text"
-
-        return "Suspicious value"
-
     def _display_issues(self, issues: List[Tuple[str, str, str]]):
         """Display a table of issues found."""
         self.console.print()
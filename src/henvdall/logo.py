@@ -16,7 +16,9 @@ LOGO = r"""
 
 TAGLINE = "The Gatekeeper of Environment Variables"
 
+_LOGO_WITH_TAGLINE = f"{LOGO}\n{'Henvdall':^98}\n{TAGLINE:^98}\n"
+
 
 def get_logo_with_tagline() -> str:
     """Return the complete logo with tagline."""
-    return f"{LOGO}\n{'Henvdall':^98}\n{TAGLINE:^98}\n"
+    return _LOGO_WITH_TAGLINE
@@ -6,9 +6,7 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from .audit import EnvAuditor
 from .logo import get_logo_with_tagline
-from .sync import EnvSyncManager
 
 app = typer.Typer(
     name="henvdall",
@@ -46,6 +44,8 @@ def sync(
     Compares your .env.example file with your local .env file and prompts
     you to fill in any missing environment variables.
     """
+    from .sync import EnvSyncManager
+
     cwd = Path.cwd()
 
     example_path = example_file or cwd / ".env.example"
@@ -78,6 +78,8 @@ def audit(
     (e.g., "YOUR_API_KEY_HERE", "admin123") that should be changed before
     running your application.
     """
+    from .audit import EnvAuditor
+
     cwd = Path.cwd()
     env_path = env_file or cwd / ".env"
 
@@ -1,8 +1,15 @@
 """Parser for .env and .env.example files."""
 
-import re
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
+
+_KEY_CHARS = bytes(
+    1 if (c.isascii() and (c.isalnum() or c == '_')) else 0
+    for c in map(chr, range(256))
+)
+
+# Characters that force a value to be quoted when written back out
+_SPECIAL_CHARS = frozenset(' #$\\')
 
 
 class EnvEntry:
@@ -20,47 +27,82 @@ class EnvEntry:
 class EnvFileParser:
     """Parser for .env files."""
 
-    ENV_LINE_PATTERN = re.compile(
-        r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*([^#]*?)(?:\s*#\s*(.*))?$'
-    )
-
     @classmethod
     def parse_file(cls, file_path: Path) -> Dict[str, EnvEntry]:
         """Parse an .env file and return a dictionary of entries."""
-        if not file_path.exists():
+        try:
+            text = file_path.read_bytes().decode('utf-8')
+        except FileNotFoundError:
             return {}
 
-        entries = {}
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.rstrip('\n')
-
-                if not line.strip() or line.strip().startswith('#'):
-                    continue
-
-                match = cls.ENV_LINE_PATTERN.match(line)
-                if match:
-                    key = match.group(1)
-                    value = match.group(2).strip()
-                    comment = match.group(3).strip() if match.group(3) else None
-
-                    value = cls._unquote_value(value)
+        if '=' not in text:
+            return {}
 
-                    entries[key] = EnvEntry(key=key, value=value, comment=comment)
+        return dict(cls._iter_entries(text))
 
-        return entries
+    @classmethod
+    def _iter_entries(cls, text: str) -> Iterator[Tuple[str, EnvEntry]]:
+        """Yield (key, entry) pairs for each assignment line in the text."""
+        # Bind loop-invariant lookups to locals once
+        key_chars = _KEY_CHARS
+        unquote = cls._unquote_value
+        make_entry = EnvEntry
+
+        for line in text.split('\n'):
+            # Blank and comment-only lines are rejected without scanning them
+            if '=' not in line:
+                continue
+
+            if line.endswith('\r'):
+                line = line[:-1]
+
+            n = len(line)
+            i = 0
+            while i < n and line[i].isspace():
+                i += 1
+
+            if i == n or line[i] == '#':
+                continue
+
+            # Keys follow shell identifier rules: [A-Za-z_][A-Za-z0-9_]*
+            start = i
+            first = ord(line[i])
+            if first > 255 or not key_chars[first] or line[i].isdigit():
+                continue
+
+            i += 1
+            while i < n and ord(line[i]) < 256 and key_chars[ord(line[i])]:
+                i += 1
+            key = line[start:i]
+
+            while i < n and line[i].isspace():
+                i += 1
+            if i == n or line[i] != '=':
+                continue
+
+            hash_pos = line.find('#', i + 1)
+            if hash_pos == -1:
+                value = line[i + 1:].strip()
+                comment = None
+            else:
+                value = line[i + 1:hash_pos].strip()
+                comment = line[hash_pos + 1:].strip() or None
+
+            yield key, make_entry(key, unquote(value), comment)
 
     @staticmethod
     def _unquote_value(value: str) -> str:
         """Remove surrounding quotes from a value if present."""
-        if len(value) >= 2:
-            if (value[0] == '"' and value[-1] == '"') or (value[0] == "'" and value[-1] == "'"):
-                return value[1:-1]
+        if len(value) < 2:
+            return value
+        quote = value[0]
+        if (quote == '"' or quote == "'") and value[-1] == quote:
+            return value[1:-1]
         return value
 
     @staticmethod
     def format_entry(key: str, value: str) -> str:
         """Format a key-value pair for writing to .env file."""
-        if ' ' in value or any(char in value for char in ['#', '$', '\\']):
+        if not _SPECIAL_CHARS.isdisjoint(value):
             value = f'"{value}"'
         return f"{key}={value}"
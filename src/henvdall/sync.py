@@ -1,5 +1,6 @@
 """Sync logic for environment variables."""
 
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -32,7 +33,7 @@ class EnvSyncManager:
 
         Returns True if any changes were made, False otherwise.
         """
-        if not example_path.exists():
+        if not os.path.exists(example_path):
             self.console.print(
                 f"[red]Error:[/red] .env.example file not found at {example_path}",
                 style="bold",
@@ -111,7 +112,7 @@ class EnvSyncManager:
 
     def _create_backup(self, env_path: Path, backup_path: Optional[Path]):
         """Create a backup of the .env file."""
-        if not env_path.exists():
+        if not os.path.exists(env_path):
             return
 
         if backup_path is None:
@@ -170,14 +171,21 @@ class EnvSyncManager:
 
     def _append_to_env(self, env_path: Path, new_entries: Dict[str, str]):
         """Append new entries to .env file."""
-        with open(env_path, 'a', encoding='utf-8') as f:
-            if env_path.exists() and env_path.stat().st_size > 0:
-                f.write('\n')
+        try:
+            needs_separator = os.stat(env_path).st_size > 0
+        except FileNotFoundError:
+            needs_separator = False
+
+        format_entry = self.parser.format_entry
+        lines = ['# Added by Henvdall']
+        lines.extend(format_entry(key, value) for key, value in new_entries.items())
 
-            f.write('# Added by Henvdall\n')
-            for key, value in new_entries.items():
-                line = self.parser.format_entry(key, value)
-                f.write(f"{line}\n")
+        payload = '\n'.join(lines) + '\n'
+        if needs_separator:
+            payload = '\n' + payload
+
+        with open(env_path, 'a', encoding='utf-8') as f:
+            f.write(payload)
 
     def _display_summary(self, new_entries: Dict[str, str]):
         """Display a summary of changes made."""
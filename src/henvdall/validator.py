@@ -1,70 +1,80 @@
 """Validation logic for environment variable values."""
 
 import re
-from typing import Optional
-from urllib.parse import urlparse
+from typing import NamedTuple, Optional
 
-from pydantic import BaseModel, Field, field_validator
 
-
-class ValidationResult(BaseModel):
+class ValidationResult(NamedTuple):
     """Result of a validation check."""
 
     is_valid: bool
     error_message: Optional[str] = None
 
 
+_OK_RESULT = ValidationResult(is_valid=True)
+
+
 class EnvValueValidator:
     """Validator for environment variable values based on type hints."""
 
-    PLACEHOLDER_PATTERNS = [
-        r"(?i)your[_\s].*here",
-        r"(?i)placeholder",
-        r"(?i)change[_\s]?me",
-        r"(?i)replace[_\s]?this",
-        r"(?i)todo",
-        r"(?i)xxx+",
-        r"^admin123$",
-        r"^password123$",
-        r"^test123$",
-        r"^secret$",
-        r"^changeme$",
-    ]
+    # Whitespace is limited to space/tab and "your ... here" is bounded so that
+    # long pasted secrets cannot trigger runaway backtracking.
+    PLACEHOLDER_PATTERN = re.compile(
+        r"(?P<text>"
+        r"your[_ \t][^\n]{0,64}here"
+        r"|placeholder"
+        r"|change[_ \t]?me"
+        r"|replace[_ \t]?this"
+        r"|todo"
+        r"|xxx+"
+        r")"
+        r"|(?P<default>^(?:admin123|password123|test123|secret|changeme)$)",
+        re.IGNORECASE,
+    )
+
+    PLACEHOLDER_REASONS = {
+        "text": "Contains placeholder text",
+        "default": "Common default value",
+    }
+
+    VALIDATION_TYPE_PATTERN = re.compile(r'\((\w+)\)')
+
+    # scheme://netloc, which is all that validate_url checks for. Brackets are
+    # only allowed as a balanced IPv6 literal, matching urlparse's rejection of
+    # hosts like "[::1".
+    URL_PATTERN = re.compile(
+        r'^[a-zA-Z][a-zA-Z0-9+.\-]*://'
+        r'(?:\[[^\]/]*\]|[^/\s?#\[\]])+'
+        r'(?=[/?#\s]|$)'
+    )
 
     @staticmethod
     def validate_int(value: str) -> ValidationResult:
         """Validate that a value is a valid integer."""
         try:
             int(value)
-            return ValidationResult(is_valid=True)
+            return _OK_RESULT
         except ValueError:
             return ValidationResult(
                 is_valid=False,
                 error_message=f"'{value}' is not a valid integer",
             )
 
-    @staticmethod
-    def validate_url(value: str) -> ValidationResult:
+    @classmethod
+    def validate_url(cls, value: str) -> ValidationResult:
         """Validate that a value is a valid URL."""
-        try:
-            result = urlparse(value)
-            if all([result.scheme, result.netloc]):
-                return ValidationResult(is_valid=True)
-            return ValidationResult(
-                is_valid=False,
-                error_message=f"'{value}' is not a valid URL (must include scheme and domain)",
-            )
-        except Exception as e:
-            return ValidationResult(
-                is_valid=False,
-                error_message=f"'{value}' is not a valid URL: {str(e)}",
-            )
+        if cls.URL_PATTERN.match(value):
+            return _OK_RESULT
+        return ValidationResult(
+            is_valid=False,
+            error_message=f"'{value}' is not a valid URL (must include scheme and domain)",
+        )
 
     @classmethod
     def validate_value(cls, value: str, validation_type: Optional[str]) -> ValidationResult:
         """Validate a value based on its type hint."""
         if not validation_type:
-            return ValidationResult(is_valid=True)
+            return _OK_RESULT
 
         validation_type = validation_type.lower().strip()
 
@@ -73,19 +83,24 @@ class EnvValueValidator:
         elif validation_type == "url":
             return cls.validate_url(value)
         else:
-            return ValidationResult(is_valid=True)
+            return _OK_RESULT
 
     @classmethod
     def is_placeholder(cls, value: str) -> bool:
         """Check if a value looks like a placeholder that needs to be changed."""
-        if not value or not value.strip():
-            return True
+        return cls.get_placeholder_reason(value) is not None
 
-        for pattern in cls.PLACEHOLDER_PATTERNS:
-            if re.search(pattern, value):
-                return True
+    @classmethod
+    def get_placeholder_reason(cls, value: str) -> Optional[str]:
+        """Return why a value looks like a placeholder, or None if it does not."""
+        if not value or value.isspace():
+            return "Empty value"
+
+        match = cls.PLACEHOLDER_PATTERN.search(value)
+        if match:
+            return cls.PLACEHOLDER_REASONS[match.lastgroup]
 
-        return False
+        return None
 
     @classmethod
     def extract_validation_type(cls, comment: str) -> Optional[str]:
@@ -93,7 +108,7 @@ class EnvValueValidator:
         if not comment:
             return None
 
-        match = re.search(r'\((\w+)\)', comment)
+        match = cls.VALIDATION_TYPE_PATTERN.search(comment)
         if match:
             return match.group(1)
 
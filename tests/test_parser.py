@@ -8,6 +8,18 @@ import pytest
 from henvdall.parser import EnvFileParser
 
 
+def _parse_content(content: str):
+    """Write content to a temporary .env file and parse it."""
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.env') as f:
+        f.write(content.encode('utf-8'))
+        temp_path = Path(f.name)
+
+    try:
+        return EnvFileParser.parse_file(temp_path)
+    finally:
+        temp_path.unlink()
+
+
 class TestEnvFileParser:
     """Tests for EnvFileParser class."""
 
@@ -74,6 +86,63 @@ NO_QUOTES=simple
         finally:
             temp_path.unlink()
 
+    def test_parse_crlf_line_endings(self):
+        """Test parsing a file with Windows line endings."""
+        content = "API_KEY=secret123\r\nPORT=3000  # (int)\r\n"
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.env') as f:
+            f.write(content.encode('utf-8'))
+            temp_path = Path(f.name)
+
+        try:
+            entries = EnvFileParser.parse_file(temp_path)
+
+            assert entries["API_KEY"].value == "secret123"
+            assert entries["PORT"].value == "3000"
+            assert entries["PORT"].comment == "(int)"
+        finally:
+            temp_path.unlink()
+
+    def test_parse_whitespace_around_equals(self):
+        """Test parsing with whitespace around the equals sign."""
+        entries = _parse_content("KEY = value\nTABBED\t=\tother\n")
+
+        assert entries["KEY"].value == "value"
+        assert entries["TABBED"].value == "other"
+
+    def test_parse_indented_assignment(self):
+        """Test parsing indented assignments."""
+        entries = _parse_content("    KEY=value\n\tOTHER=x\n")
+
+        assert entries["KEY"].value == "value"
+        assert entries["OTHER"].value == "x"
+
+    def test_parse_rejects_key_starting_with_digit(self):
+        """Test that keys starting with a digit are ignored."""
+        entries = _parse_content("1KEY=x\nKEY1=y\n")
+
+        assert "1KEY" not in entries
+        assert entries["KEY1"].value == "y"
+
+    def test_parse_rejects_invalid_key_characters(self):
+        """Test that keys with dashes or non-ASCII characters are ignored."""
+        entries = _parse_content("MY-KEY=x\nKÉY=y\nCLÉ=z\n")
+
+        assert len(entries) == 0
+
+    def test_parse_comment_directly_after_equals(self):
+        """Test parsing a comment that immediately follows the equals sign."""
+        entries = _parse_content("KEY=#c\n")
+
+        assert entries["KEY"].value == ""
+        assert entries["KEY"].comment == "c"
+
+    def test_parse_empty_trailing_comment(self):
+        """Test that an empty trailing comment is treated as no comment."""
+        entries = _parse_content("KEY=v #\n")
+
+        assert entries["KEY"].value == "v"
+        assert entries["KEY"].comment is None
+
     def test_parse_empty_file(self):
         """Test parsing an empty file."""
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.env') as f: